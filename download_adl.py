@@ -1,43 +1,306 @@
 #!/usr/bin/env python3
 import os
 import re
-import requests
+import asyncio
+import collections
+import json
+import logging
 import time
 import urllib.parse
 import argparse
+import aiofiles
+import aiohttp
+import httpx
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
 
+logger = logging.getLogger(__name__)
+
 # URL of the course page
 url = "https://ut.philkr.net/advances_in_deeplearning/"
 
+# Maximum number of files downloaded at the same time
+MAX_CONCURRENT_DOWNLOADS = 8
+
+# Maximum number of files downloaded at the same time from a single host
+MAX_DOWNLOADS_PER_HOST = 4
+
+# File in the slides directory that caches which lectures have materials
+MATERIALS_INDEX = ".materials_index.json"
+
+# How long (in seconds) a missing materials archive is remembered before probing again
+MATERIALS_MISSING_TTL = 7 * 24 * 60 * 60
+
+# Size of the chunks streamed from the network to disk
+CHUNK_SIZE = 1024 * 1024
+
+# User agent sent with every request
+USER_AGENT = "utmsai-adv-deep-learning-downloader"
+
+# Shared HTTP/2 client so the page fetch and HEAD probes are multiplexed over
+# pooled keep-alive connections
+CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(http2=True, retries=3),
+    timeout=10,
+    follow_redirects=True,
+    headers={"User-Agent": USER_AGENT}
+)
+
+# Content-Range header, e.g. "bytes 500-1199/1200" or "bytes */1200" for a 416
+_RE_CONTENT_RANGE = re.compile(r'bytes (?:(\d+)-\d+|\*)/(\d+|\*)')
+
+# Translation table that removes characters not allowed in filenames and
+# replaces spaces with underscores
+_FN_TRANS = str.maketrans({' ': '_', **dict.fromkeys('\\/*?:"<>|')})
+
+# Regular expressions for matching arxiv links
+_RE_ARXIV = re.compile(r'https://arxiv.org/abs/(\d+\.\d+)(v\d+)?')
+_RE_ARXIV_PDF = re.compile(r'https://arxiv.org/pdf/(\d+\.\d+)(v\d+)?\.pdf')
+
 # Function to sanitize filenames
 def sanitize_filename(filename):
-    # Remove characters that are not allowed in filenames
-    sanitized = re.sub(r'[\\/*?:"<>|]', "", filename)
-    # Replace spaces with underscores
-    sanitized = sanitized.replace(' ', '_')
-    # Limit filename length
-    if len(sanitized) > 150:
-        sanitized = sanitized[:150]
-    return sanitized
-
-# Function to check if a file already exists
-def file_exists(directory, filename):
-    return os.path.exists(os.path.join(directory, filename))
+    # Clean up the characters in one pass and limit the filename length
+    return filename.translate(_FN_TRANS)[:150]
+
+# Function to fetch and parse the course page
+def fetch_course_page():
+    print("Fetching webpage content...")
+    response = CLIENT.get(url)
+    return BeautifulSoup(response.content, 'lxml')
+
+# Function to check whether a lecture has a materials archive (None if unknown)
+def materials_exist(materials_url):
+    try:
+        status_code = CLIENT.head(materials_url, timeout=5).status_code
+    except Exception:
+        return None
+    if status_code == 200:
+        return True
+    if status_code == 404:
+        return False
+    return None
+
+# Function to load the materials probe results saved by previous runs
+def load_materials_index(index_path):
+    try:
+        with open(index_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+# Function to save the materials probe results for the next run
+def save_materials_index(index_path, materials_index):
+    with open(index_path, 'w') as f:
+        json.dump(materials_index, f, indent=2)
+
+# Function to check if a materials URL still needs to be probed
+def needs_materials_probe(materials_index, materials_url, now):
+    entry = materials_index.get(materials_url)
+    if entry is None:
+        return True
+    # Missing archives may be published later, so forget them after a while
+    return not entry['exists'] and now - entry['checked'] > MATERIALS_MISSING_TTL
+
+# Function to load the ETag/Last-Modified saved next to a downloaded file
+def load_meta(filepath):
+    try:
+        with open(filepath + '.meta') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+# Function to save the ETag/Last-Modified of a response next to the downloaded file
+def save_meta(filepath, headers):
+    meta = {'etag': headers.get('ETag'), 'last_modified': headers.get('Last-Modified')}
+    if meta['etag'] or meta['last_modified']:
+        with open(filepath + '.meta', 'w') as f:
+            json.dump(meta, f)
+
+# Function to record which URL and version a partial download belongs to; the
+# record also marks the .part file as created by this script
+def save_part_meta(part_path, file_url, headers):
+    meta = {'url': file_url, 'etag': headers.get('ETag'), 'last_modified': headers.get('Last-Modified')}
+    with open(part_path + '.meta', 'w') as f:
+        json.dump(meta, f)
+
+# Function to remove the ETag/Last-Modified saved next to a file, if any
+def remove_meta(filepath):
+    try:
+        os.remove(filepath + '.meta')
+    except FileNotFoundError:
+        pass
+
+# Function to move a completed partial download and its ETag/Last-Modified into place
+def finish_part(part_path, filepath):
+    os.replace(part_path, filepath)
+    part_meta = load_meta(part_path)
+    if part_meta and (part_meta.get('etag') or part_meta.get('last_modified')):
+        os.replace(part_path + '.meta', filepath + '.meta')
+    else:
+        remove_meta(part_path)
+        remove_meta(filepath)
+
+# Function to get the first byte position from a Content-Range header (None if missing)
+def content_range_start(headers):
+    match = _RE_CONTENT_RANGE.match(headers.get('Content-Range', ''))
+    return int(match.group(1)) if match and match.group(1) else None
+
+# Function to get the total file size from a Content-Range header (None if unknown)
+def content_range_total(headers):
+    match = _RE_CONTENT_RANGE.match(headers.get('Content-Range', ''))
+    return int(match.group(2)) if match and match.group(2) != '*' else None
+
+# Function to list the names of all files already in a directory
+def existing_files_in(directory):
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries}
+
+# Function to check if an existing file has nothing to revalidate with and should be skipped
+def skip_existing(existing, filename):
+    return filename in existing and filename + '.meta' not in existing
+
+# Function to remove partial downloads of the given URLs that no pending download
+# can resume. Only .part files with a .part.meta written by this script are
+# touched, so other programs' partial files (and those of the other downloader,
+# if both share a directory) are left alone
+def remove_orphaned_parts(directory, existing, jobs, urls):
+    pending = {filename + '.part' for _, _, filename, _ in jobs}
+    for name in existing:
+        if not name.endswith('.part.meta'):
+            continue
+        part_name = name[:-len('.meta')]
+        if part_name in pending:
+            continue
+        part_path = os.path.join(directory, part_name)
+        part_meta = load_meta(part_path)
+        if part_meta and part_meta.get('url') in urls:
+            if part_name in existing:
+                os.remove(part_path)
+            remove_meta(part_path)
+
+# Function to download a single file once a slot is free for its host and overall
+async def download_file(session, semaphore, host_semaphores, file_url, filepath, filename, revalidate):
+    # Download into a temporary file that only replaces the real one once complete
+    part_path = filepath + '.part'
+    try:
+        resume_from = os.path.getsize(part_path)
+    except OSError:
+        resume_from = 0
+    
+    # Only resume if the server can tell us whether the file changed since then
+    part_meta = load_meta(part_path) if resume_from else None
+    validator = part_meta and (part_meta.get('etag') or part_meta.get('last_modified'))
+    if resume_from and not validator:
+        # The partial file can't be resumed safely, so don't leave it behind (a 304
+        # below would otherwise keep it around forever)
+        os.remove(part_path)
+        remove_meta(part_path)
+        resume_from = 0
+    
+    # Byte ranges count the bytes as sent. Ask for the file without compression so the
+    # size of the .part file always matches the ranges used to resume it
+    headers = {'Accept-Encoding': 'identity'}
+    if resume_from:
+        # Continue an interrupted download where it stopped; If-Range makes the
+        # server send the whole file instead if it changed in the meantime
+        headers['Range'] = f'bytes={resume_from}-'
+        headers['If-Range'] = validator
+    else:
+        # Only fetch the body again if the file changed since the last download
+        meta = load_meta(filepath) if revalidate else None
+        if meta:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+    
+    host = urllib.parse.urlsplit(file_url).hostname
+    async with host_semaphores[host], semaphore:
+        try:
+            async with session.get(file_url, headers=headers) as response:
+                if response.status == 304:
+                    tqdm.write(f"Skipping {filename} (up to date)")
+                elif response.status == 206 and content_range_start(response.headers) != resume_from:
+                    # The server sent a different range than the one asked for
+                    os.remove(part_path)
+                    remove_meta(part_path)
+                    tqdm.write(f"Failed to resume {file_url}: unexpected Content-Range, discarded partial download")
+                elif response.status in (200, 206):
+                    # Remember which version is being downloaded, so an interrupted
+                    # download is only resumed against the same version
+                    if response.status == 200:
+                        save_part_meta(part_path, file_url, response.headers)
+                    
+                    # Append to the partial file if the server honoured the range request.
+                    # aiofiles runs each write in a worker thread so other downloads keep
+                    # going meanwhile; writing whole CHUNK_SIZE batches keeps that to one
+                    # thread hand-off per MiB rather than one per received network chunk
+                    mode = 'ab' if response.status == 206 else 'wb'
+                    async with aiofiles.open(part_path, mode) as f:
+                        # aiohttp hands over data as it arrives, which is usually far less
+                        # than CHUNK_SIZE, so collect it and write it out in full batches.
+                        # iter_chunks() yields the buffers aiohttp received as they are,
+                        # without first joining them into a new bytes object like read(n)
+                        buffer = bytearray()
+                        async for chunk, _ in response.content.iter_chunks():
+                            buffer += chunk
+                            if len(buffer) >= CHUNK_SIZE:
+                                await f.write(buffer)
+                                buffer.clear()
+                        if buffer:
+                            await f.write(buffer)
+                    finish_part(part_path, filepath)
+                    tqdm.write(f"{'Resumed' if response.status == 206 else 'Downloaded'}: {filename}")
+                elif response.status == 416 and content_range_total(response.headers) == resume_from:
+                    # The previous run finished writing but was interrupted before
+                    # moving the file into place
+                    finish_part(part_path, filepath)
+                    tqdm.write(f"Resumed: {filename}")
+                elif response.status == 416:
+                    # The partial file doesn't match the remote one, start over next run
+                    os.remove(part_path)
+                    remove_meta(part_path)
+                    tqdm.write(f"Failed to resume {file_url}: discarded partial download")
+                else:
+                    tqdm.write(f"Failed to download {file_url}: HTTP {response.status}")
+        except Exception as e:
+            tqdm.write(f"Error downloading {file_url}: {e}")
+
+# Function to download a list of (url, filepath, filename, revalidate) jobs concurrently
+async def download_all(session, semaphore, host_semaphores, jobs, desc=None):
+    tasks = [
+        download_file(session, semaphore, host_semaphores, file_url, filepath, filename, revalidate)
+        for file_url, filepath, filename, revalidate in jobs
+    ]
+    # Advance the progress bar as downloads finish, in whatever order that is
+    for task in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc=desc):
+        await task
+
+# Function to add a lecture along with the numbered, sanitized filenames it is saved under
+def add_lecture(lectures, base_dir, lecture_name, module_name, slides_url):
+    idx = len(lectures) + 1
+    module_part = f"{module_name}_" if module_name else ""
+    pdf_filename = sanitize_filename(f"{idx:02d}_{module_part}{lecture_name}.pdf")
+    materials_filename = sanitize_filename(f"{idx:02d}_{module_part}{lecture_name}_materials.zip")
+    lectures.append({
+        'name': lecture_name,
+        'module': module_name,
+        'slides_url': slides_url,
+        'pdf_filename': pdf_filename,
+        'pdf_path': os.path.join(base_dir, pdf_filename),
+        'materials_filename': materials_filename,
+        'materials_path': os.path.join(base_dir, materials_filename)
+    })
 
 # Function to download lecture slides
-def download_slides(base_dir="adl-slides"):
+async def download_slides(soup, session, semaphore, host_semaphores, base_dir="adl-slides"):
     print("\n=== Downloading Lecture Slides ===")
     
     # Create the main download directory
     os.makedirs(base_dir, exist_ok=True)
-    
-    # Get the webpage content
-    print("Fetching webpage content...")
-    response = requests.get(url)
-    soup = BeautifulSoup(response.text, 'html.parser')
+    existing = existing_files_in(base_dir)
     
     # Find all lecture links and their corresponding slide links
     print("Finding lecture slides...")
@@ -56,87 +319,81 @@ def download_slides(base_dir="adl-slides"):
     # Find all section headers
     section_headers = soup.find_all(['h1', 'h2', 'h3'])
     
+    # Index headers by their text, keeping the first header for each name, and
+    # remember which h1/h2 headers start a main section
+    main_sections_set = set(main_sections)
+    header_by_name = {}
+    section_boundaries = set()
+    for header in section_headers:
+        header_name = header.text.strip()
+        header_by_name.setdefault(header_name, header)
+        if header.name in ('h1', 'h2') and header_name in main_sections_set:
+            section_boundaries.add(id(header))
+    
     # Process each section in order
     for section_name in main_sections:
         # Find section header
-        section_header = None
-        for header in section_headers:
-            if header.text.strip() == section_name:
-                section_header = header
-                break
+        section_header = header_by_name.get(section_name)
         
         if not section_header:
             continue
         
         # Find all lecture links within this section
-        current = section_header.next_sibling
-        while current:
+        for sibling in section_header.find_next_siblings():
             # Check if we've reached the next main section
-            if current.name in ['h1', 'h2'] and current.text.strip() in main_sections:
+            if id(sibling) in section_boundaries:
                 break
             
-            # Look for lecture links
-            if hasattr(current, 'find_all'):
-                # Find lecture links
-                for link in current.find_all('a'):
-                    href = link.get('href')
-                    if not href or not href.startswith(url):
-                        continue
+            # Look for lecture slide links on the course site
+            for link in sibling.find_all('a', href=True):
+                href = link['href']
+                if not href.startswith(url) or 'slides.pdf' not in href:
+                    continue
+                
+                # Extract module and lecture name from the URL
+                path_parts = href.replace(url, '').split('/')
+                if len(path_parts) >= 3:
+                    module_name = path_parts[-3] if len(path_parts) >= 4 else ''
+                    lecture_name = path_parts[-2].replace('_', ' ').title()
                     
-                    # Check if this is a lecture page
-                    if 'slides.pdf' in href:
-                        # Extract module and lecture name from the URL
-                        path_parts = href.replace(url, '').split('/')
-                        if len(path_parts) >= 3:
-                            module_name = path_parts[-3] if len(path_parts) >= 4 else ''
-                            lecture_name = path_parts[-2].replace('_', ' ').title()
-                            
-                            # Add to lectures list
-                            lectures.append({
-                                'name': lecture_name,
-                                'module': module_name,
-                                'slides_url': href
-                            })
-                            
-                            # Check for materials
-                            materials_url = href.replace('slides.pdf', 'materials.zip')
-                            try:
-                                materials_response = requests.head(materials_url)
-                                if materials_response.status_code == 200:
-                                    lectures[-1]['materials_url'] = materials_url
-                            except:
-                                pass
-            
-            current = current.next_sibling
+                    # Add to lectures list
+                    add_lecture(lectures, base_dir, lecture_name, module_name, href)
     
     # Alternative approach: look for all slide links directly
     if not lectures:
         print("Using alternative approach to find slides...")
-        for link in soup.find_all('a'):
-            href = link.get('href')
-            if href and href.endswith('slides.pdf'):
-                slides_url = urllib.parse.urljoin(url, href)
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            if not href.endswith('slides.pdf'):
+                continue
+            slides_url = urllib.parse.urljoin(url, href)
+            
+            # Extract module and lecture name from the URL
+            path_parts = href.split('/')
+            if len(path_parts) >= 2:
+                module_name = path_parts[-3] if len(path_parts) >= 3 else ''
+                lecture_name = path_parts[-2].replace('_', ' ').title()
                 
-                # Extract module and lecture name from the URL
-                path_parts = href.split('/')
-                if len(path_parts) >= 2:
-                    module_name = path_parts[-3] if len(path_parts) >= 3 else ''
-                    lecture_name = path_parts[-2].replace('_', ' ').title()
-                    
-                    lectures.append({
-                        'name': lecture_name,
-                        'module': module_name,
-                        'slides_url': slides_url
-                    })
-                    
-                    # Check for materials link
-                    materials_url = slides_url.replace('slides.pdf', 'materials.zip')
-                    try:
-                        materials_response = requests.head(materials_url)
-                        if materials_response.status_code == 200:
-                            lectures[-1]['materials_url'] = materials_url
-                    except:
-                        pass
+                add_lecture(lectures, base_dir, lecture_name, module_name, slides_url)
+    
+    # Check for materials of all lectures concurrently, reusing results from previous runs
+    index_path = os.path.join(base_dir, MATERIALS_INDEX)
+    materials_index = load_materials_index(index_path)
+    candidate_urls = [lecture['slides_url'].replace('slides.pdf', 'materials.zip') for lecture in lectures]
+    now = time.time()
+    probe_urls = [u for u in candidate_urls if needs_materials_probe(materials_index, u, now)]
+    if probe_urls:
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = executor.map(materials_exist, probe_urls)
+            for materials_url, has_materials in zip(probe_urls, results):
+                # Only remember definite answers, so network errors are retried next run
+                if has_materials is not None:
+                    materials_index[materials_url] = {'exists': has_materials, 'checked': now}
+        save_materials_index(index_path, materials_index)
+    
+    for lecture, materials_url in zip(lectures, candidate_urls):
+        if materials_index.get(materials_url, {}).get('exists'):
+            lecture['materials_url'] = materials_url
     
     # Print what we found
     print(f"Found {len(lectures)} lectures with slides")
@@ -148,87 +405,54 @@ def download_slides(base_dir="adl-slides"):
     # Check which files already exist
     print("Checking for existing files...")
     existing_files = []
-    for idx, lecture in enumerate(lectures, 1):
-        module_part = f"{lecture.get('module', '')}_" if lecture.get('module') else ""
-        filename = sanitize_filename(f"{idx:02d}_{module_part}{lecture['name']}.pdf")
-        if file_exists(base_dir, filename):
-            existing_files.append(filename)
+    for lecture in lectures:
+        if lecture['pdf_filename'] in existing:
+            existing_files.append(lecture['pdf_filename'])
         
-        if 'materials_url' in lecture:
-            materials_filename = sanitize_filename(f"{idx:02d}_{module_part}{lecture['name']}_materials.zip")
-            if file_exists(base_dir, materials_filename):
-                existing_files.append(materials_filename)
+        if 'materials_url' in lecture and lecture['materials_filename'] in existing:
+            existing_files.append(lecture['materials_filename'])
     
     if existing_files:
-        print(f"Found {len(existing_files)} existing files that will be skipped.")
+        print(f"Found {len(existing_files)} existing files that will be skipped or checked for updates.")
     
-    # Download each lecture's slides and materials
+    # Collect the slides and materials that still need to be downloaded
     print("\nDownloading lecture slides and materials...")
-    for idx, lecture in enumerate(tqdm(lectures, desc="Downloading"), 1):
-        # Create numbered and sanitized filename based on module and lecture name
-        module_part = f"{lecture.get('module', '')}_" if lecture.get('module') else ""
-        filename = sanitize_filename(f"{idx:02d}_{module_part}{lecture['name']}.pdf")
-        filepath = os.path.join(base_dir, filename)
+    jobs = []
+    for lecture in lectures:
+        filename = lecture['pdf_filename']
         
-        # Skip if file already exists
-        if os.path.exists(filepath):
+        # Skip if file already exists and cannot be checked for updates
+        if skip_existing(existing, filename):
             tqdm.write(f"Skipping {filename} (already exists)")
         else:
-            # Download the slides
-            try:
-                slides_response = requests.get(lecture['slides_url'], stream=True)
-                if slides_response.status_code == 200:
-                    with open(filepath, 'wb') as f:
-                        for chunk in slides_response.iter_content(chunk_size=8192):
-                            f.write(chunk)
-                    tqdm.write(f"Downloaded: {filename}")
-                else:
-                    tqdm.write(f"Failed to download {lecture['slides_url']}: HTTP {slides_response.status_code}")
-                
-                # Be nice to the server
-                time.sleep(1)
-            except Exception as e:
-                tqdm.write(f"Error downloading {lecture['slides_url']}: {e}")
+            jobs.append((lecture['slides_url'], lecture['pdf_path'], filename, filename in existing))
         
         # Download materials if available
         if 'materials_url' in lecture:
-            module_part = f"{lecture.get('module', '')}_" if lecture.get('module') else ""
-            materials_filename = sanitize_filename(f"{idx:02d}_{module_part}{lecture['name']}_materials.zip")
-            materials_filepath = os.path.join(base_dir, materials_filename)
+            materials_filename = lecture['materials_filename']
+            materials_filepath = lecture['materials_path']
             
-            # Skip if file already exists
-            if os.path.exists(materials_filepath):
+            # Skip if file already exists and cannot be checked for updates
+            if skip_existing(existing, materials_filename):
                 tqdm.write(f"Skipping {materials_filename} (already exists)")
             else:
-                # Download the materials
-                try:
-                    materials_response = requests.get(lecture['materials_url'], stream=True)
-                    if materials_response.status_code == 200:
-                        with open(materials_filepath, 'wb') as f:
-                            for chunk in materials_response.iter_content(chunk_size=8192):
-                                f.write(chunk)
-                        tqdm.write(f"Downloaded: {materials_filename}")
-                    else:
-                        tqdm.write(f"Failed to download {lecture['materials_url']}: HTTP {materials_response.status_code}")
-                    
-                    # Be nice to the server
-                    time.sleep(1)
-                except Exception as e:
-                    tqdm.write(f"Error downloading {lecture['materials_url']}: {e}")
+                jobs.append((lecture['materials_url'], materials_filepath, materials_filename, materials_filename in existing))
+    
+    # Download slides and materials concurrently
+    lecture_urls = {lecture['slides_url'] for lecture in lectures}
+    lecture_urls.update(lecture['materials_url'] for lecture in lectures if 'materials_url' in lecture)
+    remove_orphaned_parts(base_dir, existing, jobs, lecture_urls)
+    await download_all(session, semaphore, host_semaphores, jobs, desc="Downloading")
     
     print("\nSlides download complete!")
 
 # Function to download research papers
-def download_papers(base_dir="adl-papers"):
+async def download_papers(soup, session, semaphore, host_semaphores, base_dir="adl-papers"):
     print("\n=== Downloading Research Papers ===")
     
     # Create the main download directory
     os.makedirs(base_dir, exist_ok=True)
-    
-    # Get the webpage content
-    print("Fetching webpage content...")
-    response = requests.get(url)
-    soup = BeautifulSoup(response.text, 'html.parser')
+    existing = existing_files_in(base_dir)
     
     # Find the References section
     references_section = None
@@ -243,84 +467,89 @@ def download_papers(base_dir="adl-papers"):
     
     # Get all list items after the References header
     papers = []
+    seen_ids = set()  # Arxiv IDs already added, so duplicates are skipped early
     ref_items = []
     
     # Find the list containing references
-    for element in references_section.find_next_siblings():
-        if element.name == 'ol':
-            ref_items = element.find_all('li')
-            break
+    ref_list = references_section.find_next_sibling('ol')
+    if ref_list:
+        ref_items = ref_list.find_all('li')
     
     if not ref_items:
         # Try another approach - look for divs with reference-like content
-        current = references_section.next_sibling
-        while current and not ref_items:
-            if hasattr(current, 'find_all'):
-                # Look for numbered items that might be references
-                potential_refs = current.find_all('p')
-                if potential_refs:
-                    ref_items = potential_refs
-            current = current.next_sibling
-    
-    # Regular expressions for matching arxiv links
-    arxiv_pattern = re.compile(r'https://arxiv.org/abs/(\d+\.\d+)(v\d+)?')
-    arxiv_pdf_pattern = re.compile(r'https://arxiv.org/pdf/(\d+\.\d+)(v\d+)?\.pdf')
+        for sibling in references_section.find_next_siblings():
+            # Look for numbered items that might be references
+            potential_refs = sibling.find_all('p')
+            if potential_refs:
+                ref_items = potential_refs
+                break
     
     # If we still don't have reference items, scan the entire page after the References section
     if not ref_items:
         print("Scanning entire page for references...")
-        # Get all elements after the References section
-        current = references_section.next_sibling
         ref_num = 1  # Start with reference 1
+        papers_by_id = {}  # Paper with the lowest reference number for each arxiv ID
         
-        while current:
-            # Check if this element contains an arxiv link
-            if hasattr(current, 'find_all'):
-                for link in current.find_all('a'):
-                    href = link.get('href')
-                    if href and (arxiv_pattern.match(href) or arxiv_pdf_pattern.match(href)):
-                        # Extract the arxiv ID
-                        if 'pdf' in href:
-                            arxiv_id = arxiv_pdf_pattern.match(href).group(1)
-                            pdf_url = href
-                        else:
-                            arxiv_id = arxiv_pattern.match(href).group(1)
-                            pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
-                        
-                        # Try to find reference number in text
-                        parent_text = link.parent.get_text() if link.parent else ""
-                        ref_match = re.search(r'(\d+)\.', parent_text)
-                        if ref_match:
-                            ref_num = int(ref_match.group(1))
-                        
-                        # Extract title and authors
-                        title_author = parent_text.replace(href, "").strip()
-                        if not title_author:
-                            title_author = f"Reference {ref_num}"
-                        
-                        papers.append({
-                            'ref_num': ref_num,
-                            'arxiv_id': arxiv_id,
-                            'title_author': title_author,
-                            'url': pdf_url
-                        })
-                        
-                        ref_num += 1  # Increment for next reference
-            current = current.next_sibling
+        # Check every link after the References section in a single pass
+        for link in references_section.find_all_next('a', href=True):
+            href = link['href']
+            pdf_match = _RE_ARXIV_PDF.match(href)
+            abs_match = None if pdf_match else _RE_ARXIV.match(href)
+            if not (pdf_match or abs_match):
+                continue
+            
+            # Extract the arxiv ID
+            if pdf_match:
+                arxiv_id = pdf_match.group(1)
+                pdf_url = href
+            else:
+                arxiv_id = abs_match.group(1)
+                pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+            
+            # Try to find reference number in text
+            parent_text = link.parent.get_text() if link.parent else ""
+            ref_match = re.search(r'(\d+)\.', parent_text)
+            if ref_match:
+                ref_num = int(ref_match.group(1))
+            
+            # Keep the paper under its lowest reference number, and skip the title
+            # extraction for duplicates that won't be used
+            found = papers_by_id.get(arxiv_id)
+            if found and found['ref_num'] <= ref_num:
+                ref_num += 1
+                continue
+            
+            # Extract title and authors
+            title_author = parent_text.replace(href, "").strip()
+            if not title_author:
+                title_author = f"Reference {ref_num}"
+            
+            papers_by_id[arxiv_id] = {
+                'ref_num': ref_num,
+                'arxiv_id': arxiv_id,
+                'title_author': title_author,
+                'url': pdf_url
+            }
+            
+            ref_num += 1  # Increment for next reference
+        papers.extend(papers_by_id.values())
     else:
         # Process each reference item
         for i, item in enumerate(ref_items):
             ref_num = i + 1  # Reference numbers start at 1
-            item_text = item.get_text()
             
-            # Look for arxiv links in this reference
+            # Look for arxiv links in this reference that weren't found yet
             arxiv_links = []
             for link in item.find_all('a'):
                 href = link.get('href')
-                if href and arxiv_pattern.match(href):
-                    arxiv_links.append((link, href, arxiv_pattern.match(href).group(1)))
-                elif href and arxiv_pdf_pattern.match(href):
-                    arxiv_links.append((link, href, arxiv_pdf_pattern.match(href).group(1)))
+                match = href and (_RE_ARXIV.match(href) or _RE_ARXIV_PDF.match(href))
+                if match and match.group(1) not in seen_ids:
+                    arxiv_links.append((link, href, match.group(1)))
+                    seen_ids.add(match.group(1))
+            
+            if not arxiv_links:
+                continue
+            item_text = item.get_text()
             
             # Process each arxiv link found
             for link, href, arxiv_id in arxiv_links:
@@ -347,26 +576,19 @@ def download_papers(base_dir="adl-papers"):
                     'url': pdf_url
                 })
     
-    # Print what we found for debugging
+    # Log what we found for debugging
     for paper in papers:
-        print(f"Found paper: #{paper['ref_num']} - {paper['title_author']} (arxiv:{paper['arxiv_id']})")
+        logger.debug("Found paper: #%d - %s (arxiv:%s)", paper['ref_num'], paper['title_author'], paper['arxiv_id'])
     
     # Sort papers by reference number
     papers.sort(key=lambda x: x['ref_num'])
     
-    # Remove duplicates (same arxiv ID)
-    unique_papers = []
-    seen_ids = set()
-    for paper in papers:
-        if paper['arxiv_id'] not in seen_ids:
-            unique_papers.append(paper)
-            seen_ids.add(paper['arxiv_id'])
+    print(f"Found {len(papers)} unique papers to download.")
     
-    print(f"Found {len(unique_papers)} unique papers to download.")
-    
-    # Download each paper
+    # Collect the papers that still need to be downloaded
     print("\nDownloading papers...")
-    for paper in tqdm(unique_papers):
+    jobs = []
+    for paper in papers:
         # Extract just the title (remove authors)
         title = paper['title_author']
         
@@ -390,29 +612,43 @@ def download_papers(base_dir="adl-papers"):
         filename = f"{paper['ref_num']:03d}_{title}_{paper['arxiv_id']}.pdf"
         filepath = os.path.join(base_dir, filename)
         
-        # Skip if file already exists
-        if os.path.exists(filepath):
+        # Skip if file already exists and cannot be checked for updates
+        if skip_existing(existing, filename):
             tqdm.write(f"Skipping {filename} (already exists)")
             continue
         
-        # Download the PDF
-        try:
-            pdf_response = requests.get(paper['url'], stream=True)
-            if pdf_response.status_code == 200:
-                with open(filepath, 'wb') as f:
-                    for chunk in pdf_response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                tqdm.write(f"Downloaded: {filename}")
-            else:
-                tqdm.write(f"Failed to download {paper['url']}: HTTP {pdf_response.status_code}")
-            
-            # Be nice to the server
-            time.sleep(1)
-        except Exception as e:
-            tqdm.write(f"Error downloading {paper['url']}: {e}")
+        jobs.append((paper['url'], filepath, filename, filename in existing))
+    
+    # Download the PDFs concurrently
+    remove_orphaned_parts(base_dir, existing, jobs, {paper['url'] for paper in papers})
+    await download_all(session, semaphore, host_semaphores, jobs)
     
     print("\nPapers download complete!")
 
+async def main_async(args):
+    # Fetch the course page once and share it between both downloaders
+    soup = fetch_course_page()
+    
+    # Share one connection pool and the download limits across the whole run
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+    host_semaphores = collections.defaultdict(lambda: asyncio.Semaphore(MAX_DOWNLOADS_PER_HOST))
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONCURRENT_DOWNLOADS,
+        limit_per_host=MAX_DOWNLOADS_PER_HOST,
+        ttl_dns_cache=300
+    )
+    # Large files on a shared, slow link may take a long time, so only time out
+    # connections that can't be opened or that stall, not whole transfers
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers={"User-Agent": USER_AGENT}) as session:
+        # Download slides if requested
+        if args.slides:
+            await download_slides(soup, session, semaphore, host_semaphores, args.slides_dir)
+        
+        # Download papers if requested
+        if args.papers:
+            await download_papers(soup, session, semaphore, host_semaphores, args.papers_dir)
+
 def main():
     # Set up command-line arguments
     parser = argparse.ArgumentParser(description='Download lecture slides and research papers from the Advances in Deep Learning course.')
@@ -420,21 +656,19 @@ def main():
     parser.add_argument('--papers', action='store_true', help='Download research papers')
     parser.add_argument('--slides-dir', default='adl-slides', help='Directory to save slides (default: adl-slides)')
     parser.add_argument('--papers-dir', default='adl-papers', help='Directory to save papers (default: adl-papers)')
+    parser.add_argument('--verbose', action='store_true', help='Print every paper found on the page')
     
     args = parser.parse_args()
+    # Only this script's messages are shown; libraries like httpx log every request at INFO
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
     
     # If no specific options are provided, download both
     if not args.slides and not args.papers:
         args.slides = True
         args.papers = True
     
-    # Download slides if requested
-    if args.slides:
-        download_slides(args.slides_dir)
-    
-    # Download papers if requested
-    if args.papers:
-        download_papers(args.papers_dir)
+    asyncio.run(main_async(args))
     
     print("\nAll downloads complete!")
 